@@ -1,7 +1,13 @@
 # unicode.py
+from __future__ import annotations
 
+import bisect
+import heapq
 import sys
-from itertools import filterfalse
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from functools import lru_cache
+from itertools import chain, compress
 from typing import Union
 
 
@@ -11,36 +17,254 @@ class _lazyclassproperty:
         self.__doc__ = fn.__doc__
         self.__name__ = fn.__name__
 
+    def __set_name__(self, owner, name):
+        self._register(owner)
+
+    def _register(self, cls):
+        # the only bookkeeping kept for a class is the _lazy_properties dict of
+        # the lazy class properties that it owns, which remains available after
+        # they have been replaced by their values
+        if "_lazy_properties" not in cls.__dict__:
+            cls._lazy_properties = {}
+        cls._lazy_properties[self.__name__] = self
+
+    def add_to_class(self, cls):
+        self._register(cls)
+        setattr(cls, self.__name__, self)
+
     def __get__(self, obj, cls):
-        if cls is None:
-            cls = type(obj)
-        if not hasattr(cls, "_intern") or any(
-            cls._intern is getattr(superclass, "_intern", [])
-            for superclass in cls.__mro__[1:]
-        ):
-            cls._intern = {}
-        attrname = self.fn.__name__
-        if attrname not in cls._intern:
-            cls._intern[attrname] = self.fn(cls)
-        return cls._intern[attrname]
+        # replace this property in the class with its computed value, so that
+        # future accesses are just plain class attribute lookups - this is only
+        # safe because unicode_set.__init_subclass__ adds the property to every
+        # subclass, so subclasses never see the value computed for this class
+        value = self.fn(cls)
+        setattr(cls, self.__name__, value)
+        return value
+
+
+UnicodeRangeList = Sequence[Union[tuple[int, int], tuple[int]]]
+
+
+# str.decode codec for converting an array("I") of code points to a str
+_UTF32_NATIVE = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def _code_points_to_str(code_points: Iterable[int]) -> str:
+    """
+    Convert code points to a str, without creating an intermediate
+    single-character str for each one.
+    """
+    # "surrogatepass" is needed since unicode_sets may include the surrogate
+    # code points 0xD800-0xDFFF
+    return array("I", code_points).tobytes().decode(_UTF32_NATIVE, "surrogatepass")
+
+
+# merged ranges of pyparsing_unicode, which cover every code point from 0x20
+_FULL_RANGE_FLAT = array("i", (0x20, sys.maxunicode))
+
+
+@lru_cache(maxsize=1)
+def _full_range_chars() -> str:
+    """
+    Return the 1.1 million characters of the full range, built once and shared
+    by every unicode_set whose merged ranges are the full range.
+    """
+    return _code_points_to_str(range(0x20, sys.maxunicode + 1))
+
+
+def _sorted_ranges(ranges: Iterable[tuple[int, ...]]) -> list[tuple[int, int]]:
+    """
+    Convert left- and right-inclusive ranges (given as 2-tuples or 1-tuples)
+    to a list of 2-tuples, sorted by first code point (ranges are usually
+    declared already in sorted order, so the sort is skipped if possible).
+    """
+    ret = [(rr[0], rr[-1]) for rr in ranges]
+    if any(ret[i] > ret[i + 1] for i in range(len(ret) - 1)):
+        ret.sort()
+    return ret
 
 
-UnicodeRangeList = list[Union[tuple[int, int], tuple[int]]]
+def _merge_ranges(*range_lists: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Merge lists of 2-tuple ranges, each already sorted by first code point (as
+    returned by _sorted_ranges), into a sorted list of disjoint 2-tuples,
+    combining any ranges that overlap or are adjacent.
+    """
+    ret: list[tuple[int, int]] = []
+    for lo, hi in heapq.merge(*range_lists):
+        if ret and lo <= ret[-1][1] + 1:
+            if hi > ret[-1][1]:
+                ret[-1] = (ret[-1][0], hi)
+        else:
+            ret.append((lo, hi))
+    return ret
+
+
+class _char_category:
+    """
+    Table of the code points that are in a character category, shared by all
+    unicode_sets. The table holds a byte (0 or 1) for every code point, and is
+    evaluated lazily, one block of code points at a time, the first time any
+    unicode_set needs it.
+
+    When a large part of the table is needed, the whole table is instead loaded
+    from the ranges pregenerated in _unicode_tables.py, if that file has ranges
+    for this category for the running Python's Unicode version.
+    """
+
+    block_size = 4096
+
+    # minimum total number of code points in the ranges of a request for the
+    # pregenerated table to be loaded (loading it takes about as long as
+    # evaluating 4 or 5 blocks); smaller sets (such as those evaluated when
+    # pyparsing is imported) are faster to evaluate directly
+    generated_table_threshold = 8 * block_size
+
+    def __init__(self, name: str, test: Callable[[str], Iterable[bool]]):
+        # test returns the results for every character in the given str; use
+        # map() over a str method, so that no Python function gets called for
+        # each character
+        self.name = name
+        self.test = test
+        # the table is stored by block number, so that only the blocks that
+        # have been needed are allocated
+        self.blocks: dict[int, bytes] = {}
+        self.generated_table_checked = False
+
+    def _load_generated_table(self) -> None:
+        import unicodedata
+
+        from ._unicode_tables import category_ranges
+
+        self.generated_table_checked = True
+        ranges = category_ranges.get(unicodedata.unidata_version, {}).get(self.name)
+        if ranges is None:
+            return
+
+        table = bytearray(sys.maxunicode + 1)
+        for i in range(0, len(ranges), 2):
+            first, last = ranges[i], ranges[i + 1]
+            table[first : last + 1] = b"\x01" * (last - first + 1)
+        block_size = self.block_size
+        self.blocks = {
+            block: bytes(table[start : start + block_size])
+            for block, start in enumerate(range(0, len(table), block_size))
+        }
+
+    def _check_generated_table(self, ranges_flat: array[int]) -> None:
+        if not self.generated_table_checked:
+            size = (
+                sum(ranges_flat[1::2]) - sum(ranges_flat[::2]) + len(ranges_flat) // 2
+            )
+            if size >= self.generated_table_threshold:
+                self._load_generated_table()
+
+    def _block(self, block: int) -> bytes:
+        ret = self.blocks.get(block)
+        if ret is None:
+            start = block * self.block_size
+            ret = self.blocks[block] = bytes(
+                self.test(_code_points_to_str(range(start, start + self.block_size)))
+            )
+        return ret
+
+    def mask(self, first: int, last: int) -> bytes:
+        """
+        Return the table entries for the code points first through last.
+        """
+        block_size = self.block_size
+        first_block, last_block = first // block_size, last // block_size
+        ret = b"".join(map(self._block, range(first_block, last_block + 1)))
+        start = first - first_block * block_size
+        return ret[start : start + last - first + 1]
+
+    def chars_in_ranges(self, ranges_flat: array[int]) -> str:
+        """
+        Return the characters in a flat array of merged ranges that are in
+        this category.
+        """
+        self._check_generated_table(ranges_flat)
+        code_points = []
+        for i in range(0, len(ranges_flat), 2):
+            first, last = ranges_flat[i], ranges_flat[i + 1]
+            code_points.append(compress(range(first, last + 1), self.mask(first, last)))
+        return _code_points_to_str(chain.from_iterable(code_points))
+
+    def bitmap_in_ranges(self, ranges_flat: array[int]) -> int:
+        """
+        Return a bitmap, as an int, of the code points in a flat array of merged
+        ranges that are in this category: bit cp is set for each code point cp.
+        """
+        self._check_generated_table(ranges_flat)
+        table = bytearray(sys.maxunicode + 1)
+        for i in range(0, len(ranges_flat), 2):
+            first, last = ranges_flat[i], ranges_flat[i + 1]
+            table[first : last + 1] = self.mask(first, last)
+        # pack the table into bits: the table entry for each code point cp is
+        # translated to bit cp & 7 of a byte, and each byte is placed at cp >> 3
+        bitmap = 0
+        for bit, translation in enumerate(_TABLE_ENTRY_TO_BIT):
+            bitmap |= int.from_bytes(table[bit::8].translate(translation), "little")
+        return bitmap
+
+
+# translate tables for converting 0/1 table entries to bit 0, 1, ..., 7 of a byte
+_TABLE_ENTRY_TO_BIT = [bytes.maketrans(b"\x01", bytes([1 << bit])) for bit in range(8)]
+
+
+def _bitmap_bytes(bitmap: int) -> bytes:
+    return bitmap.to_bytes((sys.maxunicode + 1) // 8, "little")
+
+
+def _bitmap_contains(bitmap: bytes, cp: int) -> bool:
+    if not 0 <= cp <= sys.maxunicode:
+        raise ValueError(f"code point {cp} not in range({sys.maxunicode + 1:#x})")
+    return bool((bitmap[cp >> 3] >> (cp & 7)) & 1)
+
+
+_alpha_chars = _char_category("alpha", lambda chars: map(str.isalpha, chars))
+_digit_chars = _char_category("digit", lambda chars: map(str.isdigit, chars))
+_ident_start_chars = _char_category(
+    "ident_start", lambda chars: map(str.isidentifier, chars)
+)
+_ident_body_chars = _char_category(
+    "ident_body", lambda chars: map(str.isidentifier, map("_".__add__, chars))
+)
+
+
+# characters that are always included in unicode_set.identchars, and the
+# additional characters that are always included in unicode_set.identbodychars
+_LATIN1_IDENT_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyzªµº"
+    "ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ"
+    "_"
+)
+_LATIN1_IDENTBODY_CHARS = frozenset("0123456789·")
+
+
+def _add_to_sorted_chars(chars: str, extra: frozenset[str]) -> str:
+    """
+    Add a small set of extra characters to a str of sorted, unique characters,
+    keeping it sorted; only the start of chars, up to the largest of the extra
+    characters, needs to be re-sorted.
+    """
+    split = bisect.bisect_right(chars, max(extra))
+    return "".join(sorted(extra.union(chars[:split]))) + chars[split:]
 
 
 class unicode_set:
     """
     A set of Unicode characters, for language-specific strings for
     ``alphas``, ``nums``, ``alphanums``, and ``printables``.
-    A unicode_set is defined by a list of ranges in the Unicode character
+    A unicode_set is defined by a sequence of ranges in the Unicode character
     set, in a class attribute ``_ranges``. Ranges can be specified using
     2-tuples or a 1-tuple, such as::
 
-        _ranges = [
+        _ranges = (
             (0x0020, 0x007e),
             (0x00a0, 0x00ff),
             (0x0100,),
-            ]
+        )
 
     Ranges are left- and right-inclusive. A 1-tuple of (x,) is treated as (x, x).
 
@@ -50,50 +274,133 @@ class unicode_set:
             pass
     """
 
-    _ranges: UnicodeRangeList = []
+    _ranges: UnicodeRangeList = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # add the lazy class properties inherited from the superclasses to this
+        # class (see _lazyclassproperty.__get__), unless the first superclass in
+        # the MRO that defines the name overrides it with some other attribute
+        inherited_names = {
+            name: None
+            for base in cls.__mro__[1:]
+            for name in base.__dict__.get("_lazy_properties", {})
+        }
+        for name in inherited_names:
+            if name in cls.__dict__:
+                continue
+            base = next(base for base in cls.__mro__[1:] if name in base.__dict__)
+            prop = base.__dict__.get("_lazy_properties", {}).get(name)
+            if prop is not None:
+                prop.add_to_class(cls)
+
+    @_lazyclassproperty
+    def _ranges_flat(cls) -> array[int]:
+        # all ranges defined by this class and its superclasses, merged into
+        # sorted, disjoint ranges and stored as a flat array of first, last,
+        # first, last, ... code points; this is evaluated on first use, so that
+        # _ranges may also be assigned after the class is created
+        #
+        # combine the ranges declared in this class with the already-merged
+        # ranges of its unicode_set base classes, instead of re-merging the
+        # ranges of every ancestor class
+        range_lists: list[Iterable[tuple[int, int]]] = [
+            _sorted_ranges(cls.__dict__.get("_ranges", ()))
+        ]
+        for base in cls.__bases__:  # type: ignore[attr-defined]
+            if issubclass(base, unicode_set):
+                flat = base._ranges_flat
+                range_lists.append(zip(flat[::2], flat[1::2]))
+            else:
+                range_lists.extend(
+                    _sorted_ranges(cc.__dict__.get("_ranges", ()))
+                    for cc in base.__mro__
+                )
+        return array("i", chain.from_iterable(_merge_ranges(*range_lists)))
 
     @_lazyclassproperty
-    def _chars_for_ranges(cls) -> list[str]:
-        ret: list[int] = []
-        for cc in cls.__mro__:  # type: ignore[attr-defined]
-            if cc is unicode_set:
-                break
-            for rr in getattr(cc, "_ranges", ()):
-                ret.extend(range(rr[0], rr[-1] + 1))
-        return sorted(chr(c) for c in set(ret))
+    def _chars_for_ranges(cls) -> str:
+        flat = cls._ranges_flat
+        if flat == _FULL_RANGE_FLAT:
+            return _full_range_chars()
+
+        # merged ranges are already sorted and disjoint, so there is no need
+        # to dedupe or sort the generated characters
+        return _code_points_to_str(
+            chain.from_iterable(
+                range(flat[i], flat[i + 1] + 1) for i in range(0, len(flat), 2)
+            )
+        )
 
     @_lazyclassproperty
     def printables(cls) -> str:
         """all non-whitespace characters in this range"""
-        return "".join(filterfalse(str.isspace, cls._chars_for_ranges))
+        # str.split() removes all whitespace in a single pass in C
+        return "".join(cls._chars_for_ranges.split())
 
     @_lazyclassproperty
     def alphas(cls) -> str:
         """all alphabetic characters in this range"""
-        return "".join(filter(str.isalpha, cls._chars_for_ranges))
+        return _alpha_chars.chars_in_ranges(cls._ranges_flat)
 
     @_lazyclassproperty
     def nums(cls) -> str:
         """all numeric digit characters in this range"""
-        return "".join(filter(str.isdigit, cls._chars_for_ranges))
+        return _digit_chars.chars_in_ranges(cls._ranges_flat)
 
     @_lazyclassproperty
     def alphanums(cls) -> str:
         """all alphanumeric characters in this range"""
         return cls.alphas + cls.nums
 
+    @_lazyclassproperty
+    def alphanums_set(cls) -> frozenset[str]:
+        """
+        all alphanumeric characters in this range, as a frozenset for fast
+        membership tests
+        """
+        return frozenset(chain(cls.alphas, cls.nums))
+
+    @_lazyclassproperty
+    def alphas_bitmap(cls) -> bytes:
+        """
+        bitmap of all alphabetic characters in this range, with bit ``cp & 7`` of
+        byte ``cp >> 3`` set for each included code point ``cp``
+        """
+        return _bitmap_bytes(_alpha_chars.bitmap_in_ranges(cls._ranges_flat))
+
+    @_lazyclassproperty
+    def alphanums_bitmap(cls) -> bytes:
+        """
+        bitmap of all alphanumeric characters in this range, with bit ``cp & 7``
+        of byte ``cp >> 3`` set for each included code point ``cp``
+        """
+        return _bitmap_bytes(
+            _alpha_chars.bitmap_in_ranges(cls._ranges_flat)
+            | _digit_chars.bitmap_in_ranges(cls._ranges_flat)
+        )
+
+    @classmethod
+    def contains_alpha(cls, cp: int) -> bool:
+        """
+        test whether the code point ``cp`` is an alphabetic character in this range;
+        raises ValueError if ``cp`` is not in ``range(sys.maxunicode + 1)``
+        """
+        return _bitmap_contains(cls.alphas_bitmap, cp)
+
+    @classmethod
+    def contains_alphanum(cls, cp: int) -> bool:
+        """
+        test whether the code point ``cp`` is an alphanumeric character in this range;
+        raises ValueError if ``cp`` is not in ``range(sys.maxunicode + 1)``
+        """
+        return _bitmap_contains(cls.alphanums_bitmap, cp)
+
     @_lazyclassproperty
     def identchars(cls) -> str:
         """all characters in this range that are valid identifier characters, plus underscore '_'"""
-        return "".join(
-            sorted(
-                set(filter(str.isidentifier, cls._chars_for_ranges))
-                | set(
-                    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyzªµº"
-                    "ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ"
-                    "_"
-                )
-            )
+        return _add_to_sorted_chars(
+            _ident_start_chars.chars_in_ranges(cls._ranges_flat), _LATIN1_IDENT_CHARS
         )
 
     @_lazyclassproperty
@@ -102,11 +409,11 @@ class unicode_set:
         all characters in this range that are valid identifier body characters,
         plus the digits 0-9, and · (Unicode MIDDLE DOT)
         """
-        identifier_chars = set(
-            c for c in cls._chars_for_ranges if ("_" + c).isidentifier()
-        )
-        return "".join(
-            sorted(identifier_chars | set(cls.identchars) | set("0123456789·"))
+        # every valid identifier start character is also a valid identifier
+        # body character, so this includes all the characters in identchars
+        return _add_to_sorted_chars(
+            _ident_body_chars.chars_in_ranges(cls._ranges_flat),
+            _LATIN1_IDENT_CHARS | _LATIN1_IDENTBODY_CHARS,
         )
 
     @_lazyclassproperty
@@ -128,38 +435,38 @@ class pyparsing_unicode(unicode_set):
     # fmt: off
 
     # define ranges in language character sets
-    _ranges: UnicodeRangeList = [
+    _ranges: UnicodeRangeList = (
         (0x0020, sys.maxunicode),
-    ]
+    )
 
     class BasicMultilingualPlane(unicode_set):
         """Unicode set for the Basic Multilingual Plane"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0020, 0xFFFF),
-        ]
+        )
 
     class Latin1(unicode_set):
         """Unicode set for Latin-1 Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0020, 0x007E),
             (0x00A0, 0x00FF),
-        ]
+        )
 
     class LatinA(unicode_set):
         """Unicode set for Latin-A Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0100, 0x017F),
-        ]
+        )
 
     class LatinB(unicode_set):
         """Unicode set for Latin-B Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0180, 0x024F),
-        ]
+        )
 
     class Greek(unicode_set):
         """Unicode set for Greek Unicode Character Ranges"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0342, 0x0345),
             (0x0370, 0x0377),
             (0x037A, 0x037F),
@@ -195,11 +502,11 @@ class pyparsing_unicode(unicode_set):
             (0x101A0,),
             (0x1D200, 0x1D245),
             (0x1F7A1, 0x1F7A7),
-        ]
+        )
 
     class Cyrillic(unicode_set):
         """Unicode set for Cyrillic Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0400, 0x052F),
             (0x1C80, 0x1C88),
             (0x1D2B,),
@@ -208,11 +515,11 @@ class pyparsing_unicode(unicode_set):
             (0xA640, 0xA672),
             (0xA674, 0xA69F),
             (0xFE2E, 0xFE2F),
-        ]
+        )
 
     class Chinese(unicode_set):
         """Unicode set for Chinese Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x2E80, 0x2E99),
             (0x2E9B, 0x2EF3),
             (0x31C0, 0x31E3),
@@ -231,21 +538,21 @@ class pyparsing_unicode(unicode_set):
             (0x2B820, 0x2CEA1),
             (0x2CEB0, 0x2EBE0),
             (0x2F800, 0x2FA1D),
-        ]
+        )
 
     class Japanese(unicode_set):
         """Unicode set for Japanese Unicode Character Range, combining Kanji, Hiragana, and Katakana ranges"""
 
         class Kanji(unicode_set):
             "Unicode set for Kanji Unicode Character Range"
-            _ranges: UnicodeRangeList = [
+            _ranges: UnicodeRangeList = (
                 (0x4E00, 0x9FBF),
                 (0x3000, 0x303F),
-            ]
+            )
 
         class Hiragana(unicode_set):
             """Unicode set for Hiragana Unicode Character Range"""
-            _ranges: UnicodeRangeList = [
+            _ranges: UnicodeRangeList = (
                 (0x3041, 0x3096),
                 (0x3099, 0x30A0),
                 (0x30FC,),
@@ -253,11 +560,11 @@ class pyparsing_unicode(unicode_set):
                 (0x1B001,),
                 (0x1B150, 0x1B152),
                 (0x1F200,),
-            ]
+            )
 
         class Katakana(unicode_set):
             """Unicode set for Katakana  Unicode Character Range"""
-            _ranges: UnicodeRangeList = [
+            _ranges: UnicodeRangeList = (
                 (0x3099, 0x309C),
                 (0x30A0, 0x30FF),
                 (0x31F0, 0x31FF),
@@ -267,21 +574,21 @@ class pyparsing_unicode(unicode_set):
                 (0x1B164, 0x1B167),
                 (0x1F201, 0x1F202),
                 (0x1F213,),
-            ]
+            )
 
         漢字 = Kanji
         カタカナ = Katakana
         ひらがな = Hiragana
 
-        _ranges = (
-            Kanji._ranges
-            + Hiragana._ranges
-            + Katakana._ranges
+        _ranges: UnicodeRangeList = (
+            *Kanji._ranges,
+            *Hiragana._ranges,
+            *Katakana._ranges,
         )
 
     class Hangul(unicode_set):
         """Unicode set for Hangul (Korean) Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x1100, 0x11FF),
             (0x302E, 0x302F),
             (0x3131, 0x318E),
@@ -297,7 +604,7 @@ class pyparsing_unicode(unicode_set):
             (0xFFCA, 0xFFCF),
             (0xFFD2, 0xFFD7),
             (0xFFDA, 0xFFDC),
-        ]
+        )
 
     Korean = Hangul
 
@@ -306,22 +613,22 @@ class pyparsing_unicode(unicode_set):
 
     class Thai(unicode_set):
         """Unicode set for Thai Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0E01, 0x0E3A),
             (0x0E3F, 0x0E5B)
-        ]
+        )
 
     class Arabic(unicode_set):
         """Unicode set for Arabic Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0600, 0x061B),
             (0x061E, 0x06FF),
             (0x0700, 0x077F),
-        ]
+        )
 
     class Hebrew(unicode_set):
         """Unicode set for Hebrew Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0591, 0x05C7),
             (0x05D0, 0x05EA),
             (0x05EF, 0x05F4),
@@ -331,14 +638,14 @@ class pyparsing_unicode(unicode_set):
             (0xFB40, 0xFB41),
             (0xFB43, 0xFB44),
             (0xFB46, 0xFB4F),
-        ]
+        )
 
     class Devanagari(unicode_set):
         """Unicode set for Devanagari Unicode Character Range"""
-        _ranges: UnicodeRangeList = [
+        _ranges: UnicodeRangeList = (
             (0x0900, 0x097F),
             (0xA8E0, 0xA8FF)
-        ]
+        )
 
     BMP = BasicMultilingualPlane
 
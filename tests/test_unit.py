@@ -8122,6 +8122,244 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
             print(sample)
             self.assertParseAndCheckList(pp.Word(bmp_printables), sample, [sample])
 
+    def testUnicodeSetMergedRanges(self):
+        ppu = pp.unicode
+
+        class Overlapping_set(pp.unicode_set):
+            _ranges: pp.UnicodeRangeList = [
+                (0x0061, 0x007A),
+                (0x0041, 0x004F),
+                (0x0050, 0x005A),
+                (0x0063,),
+                (0x0030, 0x0039),
+                (0x0035, 0x0045),
+            ]
+
+        class Combined_set(Overlapping_set, ppu.Japanese.Katakana):
+            _ranges: pp.UnicodeRangeList = [(0x3000, 0x30A5)]
+
+        def expected_chars(cls):
+            code_points = set()
+            for cc in cls.__mro__[: cls.__mro__.index(pp.unicode_set)]:
+                for rr in cc.__dict__.get("_ranges", ()):
+                    code_points.update(range(rr[0], rr[-1] + 1))
+            return "".join(chr(c) for c in sorted(code_points))
+
+        for unicode_set in (
+            Overlapping_set,
+            Combined_set,
+            ppu.Greek,
+            ppu.Japanese,
+            ppu.Japanese.Hiragana,
+            ppu.Japanese.Katakana,
+            ppu.CJK,
+        ):
+            with self.subTest(unicode_set=unicode_set.__name__):
+                self.assertEqual(
+                    expected_chars(unicode_set),
+                    "".join(unicode_set._chars_for_ranges),
+                )
+
+        self.assertEqual(
+            pp.srange("[0-Za-z]"), "".join(Overlapping_set._chars_for_ranges)
+        )
+
+    def testUnicodeSetIdentifierChars(self):
+        ppu = pp.unicode
+
+        latin1_identchars = set(
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyzªµº"
+            "ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ"
+            "_"
+        )
+        for unicode_set in (ppu.Latin1, ppu.Greek, ppu.CJK, ppu.BMP):
+            with self.subTest(unicode_set=unicode_set.__name__):
+                chars = unicode_set._chars_for_ranges
+                expected_identchars = "".join(
+                    sorted(set(filter(str.isidentifier, chars)) | latin1_identchars)
+                )
+                self.assertEqual(expected_identchars, unicode_set.identchars)
+                expected_identbodychars = "".join(
+                    sorted(
+                        {c for c in chars if ("_" + c).isidentifier()}
+                        | set(expected_identchars)
+                        | set("0123456789·")
+                    )
+                )
+                self.assertEqual(expected_identbodychars, unicode_set.identbodychars)
+
+    def testUnicodeSetPrintables(self):
+        ppu = pp.unicode
+
+        for unicode_set in (ppu.Latin1, ppu.BMP, ppu):
+            with self.subTest(unicode_set=unicode_set.__name__):
+                self.assertEqual(
+                    "".join(
+                        c for c in unicode_set._chars_for_ranges if not c.isspace()
+                    ),
+                    unicode_set.printables,
+                )
+
+    def testUnicodeGeneratedCategoryTables(self):
+        import itertools
+        import unicodedata
+        from pyparsing._unicode_tables import category_ranges
+
+        ppu_module = sys.modules["pyparsing.unicode"]
+        ranges_by_category = category_ranges.get(unicodedata.unidata_version)
+        if ranges_by_category is None:
+            self.skipTest(
+                f"no pregenerated tables for Unicode {unicodedata.unidata_version}"
+            )
+
+        all_chars = "".join(map(chr, range(sys.maxunicode + 1)))
+        for category in vars(ppu_module).values():
+            if not isinstance(category, ppu_module._char_category):
+                continue
+            with self.subTest(category=category.name):
+                ranges = ranges_by_category[category.name]
+                self.assertEqual(
+                    "".join(itertools.compress(all_chars, category.test(all_chars))),
+                    "".join(
+                        chr(c)
+                        for first, last in zip(ranges[::2], ranges[1::2])
+                        for c in range(first, last + 1)
+                    ),
+                    f"{category.name} table in _unicode_tables.py is out of date,"
+                    " rerun update_unicode_tables.py",
+                )
+
+        # large sets, even if made up of ranges that are each small, load the
+        # pregenerated table, and get the same characters as from evaluating it
+        for unicode_set in [pp.unicode.BMP, pp.unicode.CJK]:
+            with self.subTest(unicode_set=unicode_set.__name__):
+                category = ppu_module._char_category(
+                    "alpha", ppu_module._alpha_chars.test
+                )
+                self.assertEqual(
+                    unicode_set.alphas,
+                    category.chars_in_ranges(unicode_set._ranges_flat),
+                )
+                self.assertTrue(category.generated_table_checked)
+
+    def testUnicodeJapaneseNestedSets(self):
+        ppu = pp.pyparsing_unicode
+        japanese = ppu.Japanese
+
+        for nested, alias in [
+            (japanese.Kanji, japanese.漢字),
+            (japanese.Hiragana, japanese.ひらがな),
+            (japanese.Katakana, japanese.カタカナ),
+        ]:
+            with self.subTest(nested=nested.__name__):
+                self.assertIs(nested, alias)
+                self.assertFalse(hasattr(ppu, nested.__name__))
+                self.assertEqual(
+                    f"pyparsing_unicode.Japanese.{nested.__name__}",
+                    nested.__qualname__,
+                )
+                self.assertTrue(set(nested.printables) <= set(japanese.printables))
+
+        self.assertEqual(
+            set(japanese.Kanji.printables)
+            | set(japanese.Hiragana.printables)
+            | set(japanese.Katakana.printables),
+            set(japanese.printables),
+        )
+
+        # Japanese._ranges covers all three sets, so that it can be used to
+        # define other sets
+        def code_points(ranges):
+            return {cp for rr in ranges for cp in range(rr[0], rr[-1] + 1)}
+
+        self.assertEqual(
+            code_points(japanese.Kanji._ranges)
+            | code_points(japanese.Hiragana._ranges)
+            | code_points(japanese.Katakana._ranges),
+            code_points(japanese._ranges),
+        )
+
+    def testUnicodeSetSubclassCachedProperties(self):
+        class Base_set(pp.unicode_set):
+            _ranges: pp.UnicodeRangeList = [(0x0041, 0x005A)]
+
+        # evaluate the properties on the base class before defining a subclass
+        self.assertEqual(pp.srange("[A-Z]"), Base_set.alphas)
+
+        class Derived_set(Base_set):
+            _ranges: pp.UnicodeRangeList = [(0x0030, 0x0039)]
+
+        self.assertEqual(pp.srange("[A-Z]"), Base_set.alphas)
+        self.assertEqual(pp.srange("[A-Z]"), Derived_set.alphas)
+        self.assertEqual("", Base_set.nums)
+        self.assertEqual(pp.srange("[0-9]"), Derived_set.nums)
+        self.assertEqual(
+            pp.srange("[A-Z]") + pp.srange("[0-9]"), Derived_set.alphanums
+        )
+        self.assertEqual(set(pp.srange("[A-Z]")), Base_set.alphanums_set)
+        self.assertEqual(set(Derived_set.alphanums), Derived_set.alphanums_set)
+
+        for c in map(chr, range(0x0100)):
+            self.assertEqual(
+                c in Derived_set.alphas, Derived_set.contains_alpha(ord(c))
+            )
+            self.assertEqual(
+                c in Derived_set.alphanums, Derived_set.contains_alphanum(ord(c))
+            )
+        self.assertFalse(Derived_set.contains_alpha(sys.maxunicode))
+        for cp in [-1, sys.maxunicode + 1]:
+            with self.assertRaises(ValueError):
+                Derived_set.contains_alpha(cp)
+            with self.assertRaises(ValueError):
+                Derived_set.contains_alphanum(cp)
+
+        greek = pp.unicode.Greek
+        self.assertEqual(
+            greek.alphanums_set,
+            {
+                chr(cp)
+                for cp in range(sys.maxunicode + 1)
+                if (greek.alphanums_bitmap[cp >> 3] >> (cp & 7)) & 1
+            },
+        )
+
+        # evaluated properties are stored as plain class attributes
+        self.assertEqual(pp.srange("[A-Z]"), vars(Base_set)["alphas"])
+
+        # overriding a property in a subclass also overrides it for its subclasses
+        class Override_set(Derived_set):
+            alphas = "XYZ"
+
+        class Override_subclass_set(Override_set):
+            pass
+
+        self.assertEqual("XYZ", Override_subclass_set.alphas)
+        self.assertEqual(pp.srange("[0-9]"), Override_subclass_set.nums)
+
+        # sets covering the full range share their generated characters
+        class Full_range_set(pp.unicode_set):
+            _ranges: pp.UnicodeRangeList = [
+                (0x0020, 0xFFFF),
+                (0x10000, sys.maxunicode),
+            ]
+
+        self.assertIs(pp.unicode._chars_for_ranges, Full_range_set._chars_for_ranges)
+
+        # _ranges may also be assigned after the class is created, before the
+        # properties are first used
+        class Late_ranges_set(pp.unicode_set):
+            pass
+
+        Late_ranges_set._ranges = [(0x0041, 0x005A)]
+
+        class Late_ranges_subclass_set(Late_ranges_set):
+            _ranges: pp.UnicodeRangeList = [(0x0030, 0x0039)]
+
+        self.assertEqual(pp.srange("[A-Z]"), Late_ranges_set.alphas)
+        self.assertEqual(
+            pp.srange("[A-Z]") + pp.srange("[0-9]"), Late_ranges_subclass_set.alphanums
+        )
+
     def testUnicodeSetNameEquivalence(self):
         ppu = pp.unicode
 
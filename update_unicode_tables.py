@@ -0,0 +1,65 @@
+#
+# update_unicode_tables.py
+#
+# Regenerates pyparsing/_unicode_tables.py, adding (or replacing) the character
+# category ranges used by pyparsing.unicode for the version of the Unicode
+# database of the Python interpreter that runs this script. Tables for other
+# Unicode versions already in the file are kept, so run this script once under
+# each supported Python version:
+#
+#     python update_unicode_tables.py
+#
+import importlib
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+ppu_module = importlib.import_module("pyparsing.unicode")
+tables_module = importlib.import_module("pyparsing._unicode_tables")
+
+unicode_version = unicodedata.unidata_version
+all_chars = ppu_module._code_points_to_str(range(sys.maxunicode + 1))
+
+category_ranges = dict(tables_module.category_ranges)
+category_ranges[unicode_version] = {}
+for category in vars(ppu_module).values():
+    if not isinstance(category, ppu_module._char_category):
+        continue
+    in_category = bytes(category.test(all_chars))
+    category_ranges[unicode_version][category.name] = tuple(
+        code_point
+        for match in re.finditer(rb"\x01+", in_category)
+        for code_point in (match.start(), match.end() - 1)
+    )
+
+lines = [
+    "# _unicode_tables.py",
+    "#",
+    "# Generated by update_unicode_tables.py - do not edit",
+    "#",
+    "# For each Unicode database version, the ranges of code points in each",
+    "# character category used by pyparsing.unicode, as flat tuples of",
+    "# first, last, first, last, ... code points.",
+    "",
+    "# fmt: off",
+    "category_ranges: dict[str, dict[str, tuple[int, ...]]] = {",
+]
+for version, ranges_by_category in sorted(
+    category_ranges.items(), key=lambda item: tuple(map(int, item[0].split(".")))
+):
+    lines.append(f'    "{version}": {{')
+    for category_name, ranges in sorted(ranges_by_category.items()):
+        lines.append(f'        "{category_name}": (')
+        for i in range(0, len(ranges), 8):
+            lines.append(
+                "            "
+                + " ".join(f"0x{code_point:04X}," for code_point in ranges[i : i + 8])
+            )
+        lines.append("        ),")
+    lines.append("    },")
+lines.extend(["}", "# fmt: on", ""])
+
+tables_file = Path(tables_module.__file__)
+tables_file.write_text("\n".join(lines), encoding="utf-8")
+print(f"updated {tables_file} for Unicode version {unicode_version}")